@@ -7,12 +7,29 @@ __version__ = "0.1.0"
 __author__ = "Rahul Ratnaparkhi"
 __email__ = "ravlya02@gmail.com"
 
-from .validator import PANValidator
+from functools import lru_cache
+from .validator import PANValidator, _normalize
 from .decoder import PANDecoder
 from .exceptions import InvalidPANError
 
+try:
+    from ._pancard import validate as _validate_fast
+except ImportError:  # C extension not built; use the pure Python path
+    _validate_fast = None
+
 __all__ = ['PANValidator', 'PANDecoder', 'InvalidPANError', 'validate_pan', 'decode_pan']
 
+# Shared instances used by the convenience functions
+_DEFAULT_VALIDATOR = PANValidator()
+_DEFAULT_DECODER = PANDecoder()
+
+# Real-world PAN streams repeat heavily, so validation results are memoised.
+# Keys are normalised first so that e.g. ' abcpe1234k' and 'ABCPE1234K' share
+# an entry. Decode results are not cached: they hold mutable sections.
+@lru_cache(maxsize=4096)
+def _validate_cached(pan_number):
+    return _DEFAULT_VALIDATOR.validate(pan_number, _skip_normalize=True)
+
 def validate_pan(pan_number):
     """
     Quick validation function for PAN card number
@@ -23,8 +40,12 @@ def validate_pan(pan_number):
     Returns:
         bool: True if valid, False otherwise
     """
-    validator = PANValidator()
-    return validator.validate(pan_number)
+    if _validate_fast is not None:
+        return _validate_fast(pan_number)
+    
+    if not pan_number:
+        return False
+    return _validate_cached(_normalize(pan_number))
 
 def decode_pan(pan_number):
     """
@@ -34,7 +55,9 @@ def decode_pan(pan_number):
         pan_number (str): PAN card number to decode
         
     Returns:
-        dict: Decoded information about the PAN
+        Mapping: Decoded information about the PAN
+        
+    Raises:
+        InvalidPANError: If PAN is invalid
     """
-    decoder = PANDecoder()
-    return decoder.decode(pan_number)
\ No newline at end of file
+    return _DEFAULT_DECODER.decode(pan_number)
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Numba-compiled kernels for bulk PAN validation
+Importing this module requires numba; callers fall back to NumPy without it
+"""
+
+import numpy as np
+from numba import boolean, njit, prange, uint8
+
+@njit(boolean[:](uint8[:, :]), parallel=True, cache=True, nogil=True)
+def validate_many(buf):
+    """
+    Validate rows of PAN bytes in parallel
+
+    Args:
+        buf (numpy.ndarray): uint8 array of shape (N, 10), one PAN per row
+
+    Returns:
+        numpy.ndarray: Boolean array of length N
+    """
+    n = buf.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        ok = True
+        for j in (0, 1, 2, 4, 9):
+            c = buf[i, j]
+            ok &= (c >= 65) & (c <= 90)
+        for j in (5, 6, 7, 8):
+            c = buf[i, j]
+            ok &= (c >= 48) & (c <= 57)
+        c3 = buf[i, 3]
+        ok &= ((c3 == 80) | (c3 == 67) | (c3 == 72) | (c3 == 70) | (c3 == 65)
+               | (c3 == 84) | (c3 == 66) | (c3 == 76) | (c3 == 74) | (c3 == 71))
+        out[i] = ok
+    return out
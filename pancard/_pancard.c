@@ -0,0 +1,158 @@
+/*
+ * C accelerator for PAN card validation
+ * Mirrors PANValidator.validate; validate_pan falls back to Python without it
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+/* Non-zero for the valid fourth characters (holder type): PCHFATBLJG */
+static const unsigned char holder_table[256] = {
+    ['P'] = 1, ['C'] = 1, ['H'] = 1, ['F'] = 1, ['A'] = 1,
+    ['T'] = 1, ['B'] = 1, ['L'] = 1, ['J'] = 1, ['G'] = 1,
+};
+
+/* ASCII characters removed by str.strip() */
+static int
+is_space(unsigned char c)
+{
+    return c == ' ' || (c >= '\t' && c <= '\r') || (c >= 0x1C && c <= 0x1F);
+}
+
+static unsigned char
+to_upper(unsigned char c)
+{
+    return (c >= 'a' && c <= 'z') ? (unsigned char)(c - 32) : c;
+}
+
+static int
+is_alpha(unsigned char c)
+{
+    return c >= 'A' && c <= 'Z';
+}
+
+static int
+is_digit(unsigned char c)
+{
+    return c >= '0' && c <= '9';
+}
+
+static int
+is_ascii(PyObject *str)
+{
+#if PY_VERSION_HEX < 0x030C0000
+    if (PyUnicode_READY(str) < 0) {
+        return -1;
+    }
+#endif
+    return PyUnicode_IS_ASCII(str);
+}
+
+static PyObject *
+py_validate(PyObject *self, PyObject *arg)
+{
+    PyObject *str;
+    const char *buf;
+    Py_ssize_t start, end;
+    unsigned char c[10];
+    int i, ascii, valid;
+
+    /* Empty values are never valid */
+    valid = PyObject_IsTrue(arg);
+    if (valid < 0) {
+        return NULL;
+    }
+    if (!valid) {
+        Py_RETURN_FALSE;
+    }
+
+    if (PyUnicode_Check(arg)) {
+        Py_INCREF(arg);
+        str = arg;
+    }
+    else {
+        str = PyObject_Str(arg);
+        if (str == NULL) {
+            return NULL;
+        }
+    }
+
+    /* Non-ASCII strings are normalised by Python's own strip().upper(), since
+     * Unicode whitespace is stripped and some characters uppercase to ASCII
+     * (e.g. 'ı' -> 'I'); anything non-ASCII left afterwards makes it invalid */
+    ascii = is_ascii(str);
+    if (ascii == 0) {
+        PyObject *stripped, *upper;
+
+        stripped = PyObject_CallMethod(str, "strip", NULL);
+        Py_DECREF(str);
+        if (stripped == NULL) {
+            return NULL;
+        }
+        upper = PyObject_CallMethod(stripped, "upper", NULL);
+        Py_DECREF(stripped);
+        if (upper == NULL) {
+            return NULL;
+        }
+        str = upper;
+        ascii = is_ascii(str);
+    }
+    if (ascii <= 0) {
+        Py_DECREF(str);
+        if (ascii < 0) {
+            return NULL;
+        }
+        Py_RETURN_FALSE;
+    }
+
+    buf = PyUnicode_AsUTF8AndSize(str, &end);
+    if (buf == NULL) {
+        Py_DECREF(str);
+        return NULL;
+    }
+
+    start = 0;
+    while (start < end && is_space((unsigned char)buf[start])) {
+        start++;
+    }
+    while (end > start && is_space((unsigned char)buf[end - 1])) {
+        end--;
+    }
+
+    if (end - start != 10) {
+        Py_DECREF(str);
+        Py_RETURN_FALSE;
+    }
+
+    for (i = 0; i < 10; i++) {
+        c[i] = to_upper((unsigned char)buf[start + i]);
+    }
+    Py_DECREF(str);
+
+    valid = is_alpha(c[0]) & is_alpha(c[1]) & is_alpha(c[2]) & is_alpha(c[3])
+            & is_alpha(c[4]) & is_digit(c[5]) & is_digit(c[6]) & is_digit(c[7])
+            & is_digit(c[8]) & is_alpha(c[9]) & holder_table[c[3]];
+
+    return PyBool_FromLong(valid);
+}
+
+static PyMethodDef pancard_methods[] = {
+    {"validate", py_validate, METH_O,
+     "validate(pan_number)\n--\n\n"
+     "Return True if pan_number is a valid PAN card number."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef pancard_module = {
+    PyModuleDef_HEAD_INIT,
+    "_pancard",
+    "C accelerator for PAN card validation",
+    -1,
+    pancard_methods
+};
+
+PyMODINIT_FUNC
+PyInit__pancard(void)
+{
+    return PyModule_Create(&pancard_module);
+}
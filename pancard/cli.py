@@ -3,54 +3,132 @@ Command Line Interface for PAN Card validator
 """
 
 import sys
-import argparse
-import json
+from types import SimpleNamespace
 from .validator import PANValidator
 from .decoder import PANDecoder
 from .exceptions import InvalidPANError
 
-def main():
-    """Main CLI function"""
-    parser = argparse.ArgumentParser(
-        description='Validate and decode Indian PAN card numbers',
-        prog='pancard'
-    )
+_USAGE = "usage: pancard [-h] [-v] [-d] [-s] [-j] pan\n"
+
+_HELP = _USAGE + """
+Validate and decode Indian PAN card numbers
+
+positional arguments:
+  pan             PAN card number to validate/decode
+
+options:
+  -h, --help      show this help message and exit
+  -v, --validate  Only validate the PAN (default: validate and decode)
+  -d, --decode    Decode the PAN and show detailed information
+  -s, --summary   Show a summary of the PAN
+  -j, --json      Output in JSON format
+"""
+
+# Command line flags and the attribute each one sets
+_SHORT_FLAGS = {'v': 'validate', 'd': 'decode', 's': 'summary', 'j': 'json'}
+_LONG_FLAGS = {'--' + name: name for name in _SHORT_FLAGS.values()}
+_LONG_OPTIONS = ('--help',) + tuple(_LONG_FLAGS)
+
+def _error(message):
+    """Print a usage error and exit with status 2"""
+    sys.stderr.write(f"{_USAGE}pancard: error: {message}\n")
+    sys.exit(2)
+
+def _match_long_option(arg):
+    """
+    Resolve a long option, allowing unambiguous prefixes as argparse does
     
-    parser.add_argument(
-        'pan',
-        type=str,
-        help='PAN card number to validate/decode'
-    )
+    Args:
+        arg (str): Command line argument starting with '--'
+        
+    Returns:
+        str: The full option name, e.g. '--validate' for '--val'
+    """
+    if arg in _LONG_OPTIONS:
+        return arg
     
-    parser.add_argument(
-        '-v', '--validate',
-        action='store_true',
-        help='Only validate the PAN (default: validate and decode)'
-    )
+    matches = [option for option in _LONG_OPTIONS if option.startswith(arg)]
+    if len(matches) > 1:
+        _error(f"ambiguous option: {arg} could match {', '.join(matches)}")
+    if not matches:
+        _error(f"unrecognized arguments: {arg}")
+    return matches[0]
+
+def _parse_args(argv):
+    """
+    Parse command line arguments
     
-    parser.add_argument(
-        '-d', '--decode',
-        action='store_true',
-        help='Decode the PAN and show detailed information'
-    )
+    argparse costs more to import and set up than a whole validation, so
+    the fixed flag set is parsed by hand.
     
-    parser.add_argument(
-        '-s', '--summary',
-        action='store_true',
-        help='Show a summary of the PAN'
-    )
+    Args:
+        argv (list): Arguments without the program name
+        
+    Returns:
+        SimpleNamespace: Parsed flags and the PAN argument
+    """
+    args = SimpleNamespace(pan=None, validate=False, decode=False, summary=False, json=False)
+    positional = []
+    
+    for i, arg in enumerate(argv):
+        if arg == '--':
+            positional.extend(argv[i + 1:])
+            break
+        
+        if arg.startswith('--'):
+            option = _match_long_option(arg)
+            if option == '--help':
+                sys.stdout.write(_HELP)
+                sys.exit(0)
+            setattr(args, _LONG_FLAGS[option], True)
+        elif arg.startswith('-') and len(arg) > 1:
+            # Short flags may be combined, e.g. -vj
+            for flag in arg[1:]:
+                if flag == 'h':
+                    sys.stdout.write(_HELP)
+                    sys.exit(0)
+                if flag not in _SHORT_FLAGS:
+                    _error(f"unrecognized arguments: {arg}")
+                setattr(args, _SHORT_FLAGS[flag], True)
+        else:
+            positional.append(arg)
     
-    parser.add_argument(
-        '-j', '--json',
-        action='store_true',
-        help='Output in JSON format'
-    )
+    if not positional:
+        _error("the following arguments are required: pan")
+    if len(positional) > 1:
+        _error(f"unrecognized arguments: {' '.join(positional[1:])}")
+    
+    args.pan = positional[0]
+    return args
+
+def _dumps(obj, **options):
+    """
+    Serialize an object to JSON
     
-    args = parser.parse_args()
+    Args:
+        obj: JSON-serializable object
+        **options: Formatting options passed to json.dumps
+        
+    Returns:
+        str: JSON text
+    """
+    # Imported here so that plain-text runs never pay for the JSON encoder
+    import json
+    return json.dumps(obj, **options)
+
+def main():
+    """Main CLI function"""
+    args = _parse_args(sys.argv[1:])
     
     validator = PANValidator()
     decoder = PANDecoder()
     
+    # Pretty-print reports for terminals only; piped output stays compact
+    if sys.stdout.isatty():
+        report_format = {'indent': 2}
+    else:
+        report_format = {'separators': (',', ':')}
+    
     try:
         # Default behavior: validate and decode
         if not args.validate and not args.decode and not args.summary:
@@ -61,7 +139,7 @@ def main():
         if args.validate:
             is_valid = validator.validate(pan_number)
             if args.json:
-                print(json.dumps({'pan': pan_number, 'valid': is_valid}))
+                print(_dumps({'pan': pan_number, 'valid': is_valid}))
             else:
                 if is_valid:
                     print(f"✓ {pan_number} is a valid PAN")
@@ -75,20 +153,25 @@ def main():
             try:
                 decoded = decoder.decode(pan_number)
                 if args.json:
-                    print(json.dumps(decoded, indent=2))
+                    print(_dumps(decoded.as_dict(), **report_format))
                 else:
-                    print(f"\nPAN Card Analysis: {pan_number}")
-                    print("=" * 50)
-                    print(f"Valid: {decoded['is_valid']}")
-                    print(f"Holder Type: {decoded['holder_type']['type']}")
-                    print(f"Description: {decoded['holder_type']['description']}")
-                    print("\nCharacter Breakdown:")
-                    print("-" * 30)
-                    for item in decoded['detailed_breakdown']:
-                        print(f"Position {item['position']}: '{item['character']}' - {item['purpose']}")
+                    header = (
+                        f"\nPAN Card Analysis: {pan_number}\n"
+                        f"{'=' * 50}\n"
+                        f"Valid: {decoded['is_valid']}\n"
+                        f"Holder Type: {decoded['holder_type']['type']}\n"
+                        f"Description: {decoded['holder_type']['description']}\n"
+                        f"\nCharacter Breakdown:\n"
+                        f"{'-' * 30}\n"
+                    )
+                    breakdown = '\n'.join(
+                        f"Position {item['position']}: '{item['character']}' - {item['purpose']}"
+                        for item in decoded['detailed_breakdown']
+                    )
+                    sys.stdout.write(header + breakdown + '\n')
             except InvalidPANError as e:
                 if args.json:
-                    print(json.dumps({'error': str(e)}, indent=2))
+                    print(_dumps({'error': str(e)}, **report_format))
                 else:
                     print(f"Error: {e}")
                 sys.exit(1)
@@ -97,12 +180,12 @@ def main():
             try:
                 summary = decoder.get_summary(pan_number)
                 if args.json:
-                    print(json.dumps({'pan': pan_number, 'summary': summary}))
+                    print(_dumps({'pan': pan_number, 'summary': summary}))
                 else:
                     print(f"\nSummary: {summary}")
             except InvalidPANError as e:
                 if args.json:
-                    print(json.dumps({'error': str(e)}, indent=2))
+                    print(_dumps({'error': str(e)}, **report_format))
                 else:
                     print(f"Error: {e}")
                 sys.exit(1)
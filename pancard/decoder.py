@@ -3,15 +3,31 @@ PAN Card Decoder Module
 Decodes the meaning of different characters in Indian PAN card numbers
 """
 
-from .validator import PANValidator
+from collections.abc import Mapping
+from types import MappingProxyType
+from .validator import PANValidator, _normalize
 from .exceptions import InvalidPANError
 
+# Marks a section of a decoded PAN that has not been computed yet
+_MISSING = object()
+
 class PANDecoder:
     """
     Decoder class for Indian PAN card numbers
     Explains the meaning of each character in the PAN
     """
     
+    __slots__ = ('validator', 'holder_types', 'holder_descriptions', 'name_info',
+                 '_holder_type_arr', '_holder_desc_arr', '_pos_template')
+    
+    # Fields of the structure section that are the same for every PAN
+    _STRUCT_STATIC = MappingProxyType({
+        'pattern': 'AAAAA9999A',
+        'total_length': 10,
+        'alphabets_count': 6,
+        'digits_count': 4
+    })
+    
     def __init__(self):
         self.validator = PANValidator()
         
@@ -29,10 +45,52 @@ class PANDecoder:
             'G': 'Government'
         }
         
+        # Detailed descriptions for each holder type
+        self.holder_descriptions = {
+            'P': 'Individual taxpayer (most common type)',
+            'C': 'Company registered under the Companies Act',
+            'H': 'Hindu Undivided Family - a specific form of family arrangement recognized under Hindu Law',
+            'F': 'Partnership Firm or Limited Liability Partnership',
+            'A': 'Association of Persons or a body of individuals or a local authority or an artificial juridical person',
+            'T': 'Trust entities including public or private trusts',
+            'B': 'Body of Individuals - group of individuals carrying on business',
+            'L': 'Local Authority like Municipalities, Panchayats, etc.',
+            'J': 'Artificial Juridical Person not covered above',
+            'G': 'Government agencies and departments'
+        }
+        
+        # Lookup tables indexed by ord() of the fourth character, used on
+        # the decode path instead of dict lookups
+        holder_type_arr = [None] * 128
+        holder_desc_arr = [None] * 128
+        for code, holder_type in self.holder_types.items():
+            holder_type_arr[ord(code)] = holder_type
+            holder_desc_arr[ord(code)] = self.holder_descriptions[code]
+        self._holder_type_arr = tuple(holder_type_arr)
+        self._holder_desc_arr = tuple(holder_desc_arr)
+        
         # Mapping for the fifth character (name initial)
         self.name_info = {
             'description': 'First letter of PAN holder\'s last name/surname'
         }
+        
+        # Static per-position breakdown entries; only the character (and the
+        # holder status at position 4) vary between PANs
+        purposes = (
+            ['Part of alphabetic series (AAA-ZZZ)'] * 3
+            + ['Holder status - {}', 'First letter of surname/last name']
+            + [f'Sequential number (digit {i} of 4)' for i in range(1, 5)]
+            + ['Check digit for validation']
+        )
+        self._pos_template = tuple(
+            {
+                'position': i + 1,
+                'character': None,
+                'type': 'Digit' if 5 <= i <= 8 else 'Alphabet',
+                'purpose': purpose
+            }
+            for i, purpose in enumerate(purposes)
+        )
     
     def decode(self, pan_number):
         """
@@ -42,7 +100,8 @@ class PANDecoder:
             pan_number (str): PAN card number to decode
             
         Returns:
-            dict: Dictionary containing decoded information
+            Mapping: Decoded information; sections are computed on first
+            access, use as_dict() for a plain dict
             
         Raises:
             InvalidPANError: If PAN is invalid
@@ -50,22 +109,25 @@ class PANDecoder:
         if not pan_number:
             raise InvalidPANError("PAN number cannot be empty")
         
-        pan_number = str(pan_number).strip().upper()
+        pan_number = _normalize(pan_number)
         
         # Validate before decoding
-        if not self.validator.validate(pan_number):
+        if not self.validator.validate(pan_number, _skip_normalize=True):
             raise InvalidPANError(f"Invalid PAN format: {pan_number}")
         
-        decoded = {
-            'pan_number': pan_number,
-            'is_valid': True,
-            'structure': self._get_structure_info(pan_number),
-            'components': self._get_components(pan_number),
-            'holder_type': self._get_holder_type(pan_number),
-            'detailed_breakdown': self._get_detailed_breakdown(pan_number)
-        }
+        return self._decode_validated(pan_number)
+    
+    def _decode_validated(self, pan_number):
+        """
+        Decode a PAN that is already normalised and known to be valid
         
-        return decoded
+        Args:
+            pan_number (str): Valid, normalised PAN number
+            
+        Returns:
+            Mapping: Decoded information
+        """
+        return _DecodedPAN(pan_number, self)
     
     def _get_structure_info(self, pan_number):
         """
@@ -78,10 +140,7 @@ class PANDecoder:
             dict: Structure information
         """
         return {
-            'pattern': 'AAAAA9999A',
-            'total_length': 10,
-            'alphabets_count': 6,
-            'digits_count': 4,
+            **self._STRUCT_STATIC,
             'format': f"{pan_number[:5]} (alphabets) + {pan_number[5:9]} (digits) + {pan_number[9]} (alphabet)"
         }
     
@@ -102,7 +161,7 @@ class PANDecoder:
             },
             'fourth_letter': {
                 'value': pan_number[3],
-                'meaning': self.holder_types.get(pan_number[3], 'Unknown'),
+                'meaning': self._holder_type_arr[ord(pan_number[3])] or 'Unknown',
                 'category': 'Status of the PAN holder'
             },
             'fifth_letter': {
@@ -135,7 +194,7 @@ class PANDecoder:
         fourth_char = pan_number[3]
         return {
             'code': fourth_char,
-            'type': self.holder_types.get(fourth_char, 'Unknown'),
+            'type': self._holder_type_arr[ord(fourth_char)] or 'Unknown',
             'description': self._get_holder_description(fourth_char)
         }
     
@@ -149,19 +208,10 @@ class PANDecoder:
         Returns:
             str: Detailed description
         """
-        descriptions = {
-            'P': 'Individual taxpayer (most common type)',
-            'C': 'Company registered under the Companies Act',
-            'H': 'Hindu Undivided Family - a specific form of family arrangement recognized under Hindu Law',
-            'F': 'Partnership Firm or Limited Liability Partnership',
-            'A': 'Association of Persons or a body of individuals or a local authority or an artificial juridical person',
-            'T': 'Trust entities including public or private trusts',
-            'B': 'Body of Individuals - group of individuals carrying on business',
-            'L': 'Local Authority like Municipalities, Panchayats, etc.',
-            'J': 'Artificial Juridical Person not covered above',
-            'G': 'Government agencies and departments'
-        }
-        return descriptions.get(code, 'Unknown holder type')
+        index = ord(code)
+        if index < 128:
+            return self._holder_desc_arr[index] or 'Unknown holder type'
+        return 'Unknown holder type'
     
     def _get_detailed_breakdown(self, pan_number):
         """
@@ -173,48 +223,13 @@ class PANDecoder:
         Returns:
             list: List of character information
         """
-        breakdown = []
-        
-        for i, char in enumerate(pan_number):
-            position = i + 1
-            
-            if i < 3:
-                info = {
-                    'position': position,
-                    'character': char,
-                    'type': 'Alphabet',
-                    'purpose': 'Part of alphabetic series (AAA-ZZZ)'
-                }
-            elif i == 3:
-                info = {
-                    'position': position,
-                    'character': char,
-                    'type': 'Alphabet',
-                    'purpose': f'Holder status - {self.holder_types.get(char, "Unknown")}'
-                }
-            elif i == 4:
-                info = {
-                    'position': position,
-                    'character': char,
-                    'type': 'Alphabet',
-                    'purpose': 'First letter of surname/last name'
-                }
-            elif 5 <= i <= 8:
-                info = {
-                    'position': position,
-                    'character': char,
-                    'type': 'Digit',
-                    'purpose': f'Sequential number (digit {i-4} of 4)'
-                }
-            else:  # i == 9
-                info = {
-                    'position': position,
-                    'character': char,
-                    'type': 'Alphabet',
-                    'purpose': 'Check digit for validation'
-                }
-            
-            breakdown.append(info)
+        breakdown = [
+            {**template, 'character': char}
+            for template, char in zip(self._pos_template, pan_number)
+        ]
+        breakdown[3]['purpose'] = breakdown[3]['purpose'].format(
+            self._holder_type_arr[ord(pan_number[3])] or 'Unknown'
+        )
         
         return breakdown
     
@@ -239,4 +254,62 @@ class PANDecoder:
             f"The unique identification number is {decoded['components']['next_four_digits']['value']}."
         )
         
-        return summary
\ No newline at end of file
+        return summary
+
+class _DecodedPAN(Mapping):
+    """
+    Read-only mapping returned by PANDecoder.decode
+    
+    Sections are computed on first access and cached, so callers that only
+    read a field or two skip building the rest.
+    """
+    
+    __slots__ = ('pan_number', '_cache', '_decoder')
+    
+    # Lazily computed keys and the PANDecoder method that builds each one
+    _GETTERS = {
+        'structure': PANDecoder._get_structure_info,
+        'components': PANDecoder._get_components,
+        'holder_type': PANDecoder._get_holder_type,
+        'detailed_breakdown': PANDecoder._get_detailed_breakdown
+    }
+    
+    _KEYS = ('pan_number', 'is_valid', 'structure', 'components', 'holder_type',
+             'detailed_breakdown')
+    
+    def __init__(self, pan_number, decoder):
+        self.pan_number = pan_number
+        self._cache = {'pan_number': pan_number, 'is_valid': True}
+        self._decoder = decoder
+    
+    def __getitem__(self, key):
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._GETTERS[key](self._decoder, self.pan_number)
+            self._cache[key] = value
+        return value
+    
+    def __iter__(self):
+        return iter(self._KEYS)
+    
+    def __len__(self):
+        return len(self._KEYS)
+    
+    def __repr__(self):
+        return repr(self.as_dict())
+    
+    def as_dict(self):
+        """
+        Compute every section and return them as a plain dict
+        
+        Returns:
+            dict: Decoded information, suitable for JSON serialization
+        """
+        cache = self._cache
+        decoded = {}
+        for key in self._KEYS:
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = self._GETTERS[key](self._decoder, self.pan_number)
+            decoded[key] = value
+        return decoded
\ No newline at end of file
@@ -4,8 +4,74 @@ Validates Indian PAN card numbers according to the standard format
 """
 
 import re
+import string
+from functools import lru_cache
 from .exceptions import InvalidPANError
 
+# Compiled once per process and shared by every PANValidator
+_PAN_RE = re.compile(r'^[A-Z]{5}[0-9]{4}[A-Z]$')
+
+# Fourth character should be one of these based on holder type
+_HOLDER_SET = frozenset('PCHFATBLJG')
+
+# Collapses every letter to 'A' and every digit to '0', so a well-formed
+# PAN translates to the literal 'AAAAA0000A' (used by validate_strict to
+# report which block is wrong)
+_CANON = str.maketrans({
+    **{char: 'A' for char in string.ascii_uppercase},
+    **{char: '0' for char in string.digits}
+})
+
+# Descriptions of the valid fourth characters (holder type)
+_FOURTH_DESC = {
+    'P': 'Individual',
+    'C': 'Company',
+    'H': 'Hindu Undivided Family (HUF)',
+    'F': 'Firm',
+    'A': 'Association of Persons (AOP)',
+    'T': 'Trust',
+    'B': 'Body of Individuals (BOI)',
+    'L': 'Local Authority',
+    'J': 'Artificial Juridical Person',
+    'G': 'Government'
+}
+
+@lru_cache(maxsize=None)
+def _batch_backend():
+    """
+    Import the optional bulk-validation dependencies on first use
+    
+    numpy and numba are slow to import, so they are kept off the import
+    path of the package (and the CLI).
+    
+    Returns:
+        tuple: (numpy module or None, Numba validate_many kernel or None)
+    """
+    try:
+        import numpy as np
+    except ImportError:  # numpy is only needed for validate_batch
+        return None, None
+    
+    try:
+        from ._fastval import validate_many
+    except ImportError:  # numba is optional; validate_batch falls back to NumPy
+        validate_many = None
+    
+    return np, validate_many
+
+def _normalize(pan_number):
+    """
+    Normalise a PAN number to uppercase with surrounding whitespace removed
+    
+    Args:
+        pan_number: PAN card number, a non-empty str or any object with a
+            str() form
+        
+    Returns:
+        str: Normalised PAN number
+    """
+    return str(pan_number).strip().upper()
+
 class PANValidator:
     """
     Validator class for Indian PAN card numbers
@@ -17,17 +83,21 @@ class PANValidator:
     """
     
     # PAN card regex pattern
-    PAN_PATTERN = r'^[A-Z]{5}[0-9]{4}[A-Z]$'
+    PAN_PATTERN = _PAN_RE.pattern
+    
+    __slots__ = ('pattern',)
     
     def __init__(self):
-        self.pattern = re.compile(self.PAN_PATTERN)
+        self.pattern = _PAN_RE
     
-    def validate(self, pan_number):
+    def validate(self, pan_number, _skip_normalize=False):
         """
         Validate a PAN card number
         
         Args:
             pan_number (str): PAN card number to validate
+            _skip_normalize (bool): Internal; set when pan_number has already
+                been normalised by the caller
             
         Returns:
             bool: True if valid, False otherwise
@@ -39,7 +109,8 @@ class PANValidator:
             return False
         
         # Convert to uppercase for validation
-        pan_number = str(pan_number).strip().upper()
+        if not _skip_normalize:
+            pan_number = _normalize(pan_number)
         
         # Check length
         if len(pan_number) != 10:
@@ -52,6 +123,61 @@ class PANValidator:
         # Additional validation rules
         return self._validate_structure(pan_number)
     
+    def validate_batch(self, pans):
+        """
+        Validate many PAN card numbers at once using NumPy (or a
+        Numba-compiled kernel when numba is installed)
+        
+        Inputs are expected to be normalised already (uppercase, no
+        surrounding whitespace); unlike validate(), no conversion is done.
+        Non-ASCII rows come back False. NumPy string dtypes drop trailing NUL
+        characters, so 'ABCPE1234K\\x00' is treated as 'ABCPE1234K'.
+        
+        Args:
+            pans (array-like): PAN numbers as str or bytes; a single string
+                gives a one-element result
+            
+        Returns:
+            numpy.ndarray: Boolean array, True where the PAN is valid
+            
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        np, validate_many = _batch_backend()
+        if np is None:
+            raise ImportError("validate_batch requires numpy to be installed")
+        
+        pans = np.asarray(pans).reshape(-1)
+        
+        # Non-ASCII characters become '?', so those rows come back False
+        if pans.dtype.kind == 'U':
+            pans = np.char.encode(pans, 'ascii', 'replace')
+        elif pans.dtype.kind == 'O':
+            # e.g. pandas string columns; elements may be str or bytes
+            pans = np.array(
+                [p.encode('ascii', 'replace') if isinstance(p, str) else p for p in pans],
+                dtype='S11'
+            )
+        
+        # One spare byte per row catches inputs longer than 10 characters,
+        # which would otherwise be truncated to a valid-looking prefix
+        a = pans.astype('S11').view(np.uint8).reshape(-1, 11)
+        
+        if validate_many is not None:
+            return validate_many(a[:, :10]) & (a[:, 10] == 0)
+        
+        alpha = (a >= 65) & (a <= 90)
+        digit = (a >= 48) & (a <= 57)
+        
+        holder_lut = np.zeros(256, dtype=bool)
+        holder_lut[[ord(char) for char in 'PCHFATBLJG']] = True
+        
+        return (
+            alpha[:, 0] & alpha[:, 1] & alpha[:, 2] & alpha[:, 3] & alpha[:, 4]
+            & digit[:, 5] & digit[:, 6] & digit[:, 7] & digit[:, 8]
+            & alpha[:, 9] & (a[:, 10] == 0) & holder_lut[a[:, 3]]
+        )
+    
     def _validate_structure(self, pan_number):
         """
         Validate the structure and business rules of PAN
@@ -62,10 +188,7 @@ class PANValidator:
         Returns:
             bool: True if structure is valid
         """
-        # Fourth character should be one of these based on holder type
-        valid_fourth_chars = ['P', 'C', 'H', 'F', 'A', 'T', 'B', 'L', 'J', 'G']
-        
-        if pan_number[3] not in valid_fourth_chars:
+        if pan_number[3] not in _HOLDER_SET:
             return False
         
         return True
@@ -86,37 +209,28 @@ class PANValidator:
         if not pan_number:
             raise InvalidPANError("PAN number cannot be empty")
         
-        pan_number = str(pan_number).strip().upper()
+        pan_number = _normalize(pan_number)
         
         if len(pan_number) != 10:
             raise InvalidPANError(f"PAN must be exactly 10 characters, got {len(pan_number)}")
         
-        if not pan_number[:5].isalpha():
+        # Reduce to the 'AAAAA0000A' shape once, then check each block with
+        # plain ASCII comparisons; non-ASCII letters and digits are rejected
+        shape = pan_number.translate(_CANON)
+        
+        if not shape.startswith('AAAAA'):
             raise InvalidPANError("First 5 characters must be alphabets")
         
-        if not pan_number[5:9].isdigit():
+        if not shape.startswith('0000', 5):
             raise InvalidPANError("Characters 6-9 must be digits")
         
-        if not pan_number[9].isalpha():
+        if not shape.endswith('A'):
             raise InvalidPANError("Last character must be an alphabet")
         
-        valid_fourth_chars = {
-            'P': 'Individual',
-            'C': 'Company',
-            'H': 'Hindu Undivided Family (HUF)',
-            'F': 'Firm',
-            'A': 'Association of Persons (AOP)',
-            'T': 'Trust',
-            'B': 'Body of Individuals (BOI)',
-            'L': 'Local Authority',
-            'J': 'Artificial Juridical Person',
-            'G': 'Government'
-        }
-        
-        if pan_number[3] not in valid_fourth_chars:
+        if pan_number[3] not in _HOLDER_SET:
             raise InvalidPANError(
                 f"Fourth character '{pan_number[3]}' is invalid. "
-                f"Must be one of: {', '.join(valid_fourth_chars.keys())}"
+                f"Must be one of: {', '.join(_FOURTH_DESC)}"
             )
         
         return True
\ No newline at end of file
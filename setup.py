@@ -2,7 +2,7 @@
 Setup configuration for pancard package
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 
 # Read the README file
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -23,6 +23,11 @@ setup(
         "Source Code": "https://github.com/ravlya02/pancard",
     },
     packages=find_packages(),
+    # Optional C accelerator; installation falls back to pure Python if it
+    # cannot be compiled
+    ext_modules=[
+        Extension("pancard._pancard", ["pancard/_pancard.c"], optional=True),
+    ],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -47,6 +47,12 @@ class TestPANValidator:
         assert self.validator.validate("abcpe1234k") == True
         assert self.validator.validate("ABCPE1234K") == True
     
+    def test_unicode_uppercase_mapping(self):
+        """Test that characters whose uppercase form is ASCII are accepted"""
+        # 'ı'.upper() == 'I' and 'ﬀ'.upper() == 'FF'
+        assert self.validator.validate("CPıBG1237B") == True
+        assert self.validator.validate("ABﬀE1234K") == True
+    
     def test_validate_strict(self):
         """Test strict validation with exceptions"""
         # Valid PAN should not raise exception
@@ -70,6 +76,13 @@ class TestPANValidator:
         
         with pytest.raises(InvalidPANError, match="Fourth character"):
             self.validator.validate_strict("ABCXE1234K")
+        
+        # Only ASCII letters and digits are accepted
+        with pytest.raises(InvalidPANError, match="First 5 characters must be alphabets"):
+            self.validator.validate_strict("ÀBCPE1234K")
+        
+        with pytest.raises(InvalidPANError, match="Characters 6-9 must be digits"):
+            self.validator.validate_strict("ABCPE١٢٣٤K")
     
     def test_fourth_character_validation(self):
         """Test validation of fourth character (holder type)"""
@@ -81,6 +94,61 @@ class TestPANValidator:
         
         # Test invalid fourth character
         assert self.validator.validate("ABCXE1234K") == False
+    
+    def test_validate_honours_overrides(self):
+        """Test that validate uses the instance pattern and structure rules"""
+        import re
+        
+        class NoGovernmentValidator(PANValidator):
+            def _validate_structure(self, pan_number):
+                return pan_number[3] != 'G' and super()._validate_structure(pan_number)
+        
+        assert NoGovernmentValidator().validate("ABCGE1234K") == False
+        assert NoGovernmentValidator().validate("ABCPE1234K") == True
+        
+        self.validator.pattern = re.compile(r'^[A-Z]{5}0{4}[A-Z]$')
+        assert self.validator.validate("ABCPE1234K") == False
+        assert self.validator.validate("ABCPE0000K") == True
+    
+    def test_validate_batch(self):
+        """Test bulk validation matches single validation"""
+        np = pytest.importorskip("numpy")
+        pans = [
+            "ABCPE1234K",
+            "XYZPC5678L",
+            "ABCXE1234K",   # Invalid 4th character
+            "ABCPE12K4K",   # Letter in digit block
+            "ABCD1234K",    # 9 characters
+            "ABCPE1234KX",  # 11 characters
+            "",
+        ]
+        result = self.validator.validate_batch(pans)
+        
+        assert result.dtype == np.bool_
+        assert result.tolist() == [self.validator.validate(pan) for pan in pans]
+        assert self.validator.validate_batch(np.array([b"DEFCH7890M"])).tolist() == [True]
+    
+    def test_validate_batch_non_ascii(self):
+        """Test that non-ASCII rows are invalid rather than raising"""
+        np = pytest.importorskip("numpy")
+        pans = ["ÀBCPE1234K", "ABCPE1234K", "ABCPE١٢٣٤K"]
+        assert self.validator.validate_batch(pans).tolist() == [False, True, False]
+        
+        # Object arrays, as used by pandas string columns, may mix str and bytes
+        pans = np.array(["ABCPE1234K", "ÀBCPE1234K", b"XYZPC5678L"], dtype=object)
+        assert self.validator.validate_batch(pans).tolist() == [True, False, True]
+    
+    def test_validate_batch_single_string(self):
+        """Test that a bare string gives a one-element result"""
+        pytest.importorskip("numpy")
+        assert self.validator.validate_batch("ABCPE1234K").tolist() == [True]
+    
+    def test_validate_batch_without_numba(self, monkeypatch):
+        """Test the pure NumPy path of bulk validation"""
+        np = pytest.importorskip("numpy")
+        monkeypatch.setattr("pancard.validator._batch_backend", lambda: (np, None))
+        pans = ["ABCPE1234K", "ABCXE1234K", "ABCPE1234KX"]
+        assert self.validator.validate_batch(pans).tolist() == [True, False, False]
 
 
 class TestPANDecoder:
@@ -118,6 +186,17 @@ class TestPANDecoder:
         assert components['next_four_digits']['value'] == '5678'
         assert components['last_letter']['value'] == 'M'
     
+    def test_decoder_and_results_copyable(self):
+        """Test that decoders and decoded results pickle and deep-copy"""
+        import copy
+        import pickle
+        
+        result = self.decoder.decode("ABCPE1234K")
+        
+        assert pickle.loads(pickle.dumps(self.decoder)).decode("ABCPE1234K") == result
+        assert pickle.loads(pickle.dumps(result)) == result
+        assert copy.deepcopy(result) == result
+    
     def test_holder_types(self):
         """Test different holder types"""
         test_cases = {
@@ -160,6 +239,19 @@ class TestPANDecoder:
         assert 'Individual' in breakdown[3]['purpose']
         assert breakdown[4]['character'] == 'E'
         assert 'surname' in breakdown[4]['purpose'].lower()
+    
+    def test_decode_as_dict(self):
+        """Test that decoded results convert to a plain, JSON-ready dict"""
+        import json
+        
+        result = self.decoder.decode("ABCPE1234K")
+        as_dict = result.as_dict()
+        
+        assert type(as_dict) is dict
+        assert list(result) == list(as_dict)
+        assert result == as_dict
+        assert json.loads(json.dumps(as_dict))['holder_type']['code'] == 'P'
+        assert repr(result) == repr(as_dict)
 
 
 class TestModuleFunctions:
@@ -179,6 +271,73 @@ class TestModuleFunctions:
         
         with pytest.raises(InvalidPANError):
             decode_pan("INVALID")
+    
+    def test_decode_results_not_shared(self):
+        """Test that mutating one decode result does not leak into the next"""
+        decode_pan("ABCPE1234K")['detailed_breakdown'][0]['character'] = 'Z'
+        assert decode_pan("abcpe1234k")['detailed_breakdown'][0]['character'] == 'A'
+    
+    def test_validate_cached_by_normalized_pan(self, monkeypatch):
+        """Test that equivalent inputs share an entry in the Python fallback cache"""
+        import pancard
+        
+        monkeypatch.setattr(pancard, "_validate_fast", None)
+        pancard._validate_cached.cache_clear()
+        
+        assert validate_pan("abcpe1234k") == True
+        assert validate_pan(" ABCPE1234K ") == True
+        assert validate_pan("ABCXE1234K") == False
+        
+        info = pancard._validate_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+
+class TestCExtension:
+    """Test the optional C accelerator against the pure Python validator"""
+    
+    def test_matches_python_validator(self):
+        """Test that both implementations agree on valid and invalid input"""
+        _pancard = pytest.importorskip("pancard._pancard")
+        validator = PANValidator()
+        pans = [
+            "ABCPE1234K", " abcpe1234k\n", "\u00a0ABCPE1234K", "ABCXE1234K",
+            "ABCPE1234KX", "ABCPE12K4K", "ÀBCPE1234K", "CPıBG1237B", "ABﬀE1234K",
+            "", None, 1234567890,
+        ]
+        
+        for pan in pans:
+            assert _pancard.validate(pan) == validator.validate(pan), f"Failed for {pan!r}"
+
+
+class TestCLI:
+    """Test command line argument parsing"""
+    
+    def test_parse_args(self):
+        """Test flags, combined short flags and the PAN argument"""
+        from pancard.cli import _parse_args
+        
+        args = _parse_args(["-vj", "--summary", "ABCPE1234K"])
+        assert args.pan == "ABCPE1234K"
+        assert args.validate and args.json and args.summary
+        assert not args.decode
+    
+    def test_parse_args_abbreviations(self):
+        """Test that unambiguous long option prefixes are accepted"""
+        from pancard.cli import _parse_args
+        
+        args = _parse_args(["--val", "--j", "ABCPE1234K"])
+        assert args.validate and args.json
+        assert not args.decode and not args.summary
+    
+    def test_parse_args_errors(self, capsys):
+        """Test that bad arguments exit with usage status 2"""
+        from pancard.cli import _parse_args
+        
+        for argv in ([], ["-x", "ABCPE1234K"], ["ABCPE1234K", "EXTRA"]):
+            with pytest.raises(SystemExit) as exc_info:
+                _parse_args(argv)
+            assert exc_info.value.code == 2
+        assert "usage: pancard" in capsys.readouterr().err
 
 
 class TestEdgeCases: